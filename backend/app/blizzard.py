@@ -0,0 +1,138 @@
+import hashlib
+import time
+from typing import Optional
+
+import httpx
+from fastapi import HTTPException, Request
+
+from .cache import get_cache
+from .config import (
+    BATTLE_NET_TOKEN_URL,
+    BATTLE_NET_USERINFO_URL,
+    CHARACTER_CACHE_TTL,
+    USERINFO_CACHE_TTL,
+    get_settings,
+)
+
+# Refresh the client credentials token this many seconds before it expires
+TOKEN_REFRESH_MARGIN = 60
+
+_client: Optional[httpx.AsyncClient] = None
+_token: Optional[str] = None
+_token_expires_at = 0.0
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=get_settings().http_timeout,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client used for all Blizzard requests"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _new_client()
+    return _client
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def get_access_token(req: Request) -> str:
+    """Extract the user's bearer token from the request"""
+    access_token = req.headers.get('Authorization', '').replace('Bearer ', '')
+    if not access_token:
+        raise HTTPException(status_code=401, detail="No access token provided")
+    return access_token
+
+async def _request_battle_net_token():
+    settings = get_settings()
+    try:
+        response = await get_client().post(
+            BATTLE_NET_TOKEN_URL,
+            data={
+                'grant_type': 'client_credentials',
+                'client_id': settings.client_id,
+                'client_secret': settings.client_secret
+            }
+        )
+
+        if response.status_code != 200:
+            raise HTTPException(status_code=response.status_code, detail="Failed to get Battle.net token")
+
+        data = response.json()
+        access_token = data['access_token']
+        expires_in = max(data.get('expires_in', 0) - TOKEN_REFRESH_MARGIN, 1)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting Battle.net token: {str(e)}")
+
+    return {'access_token': access_token, 'expires_at': time.time() + expires_in}
+
+async def get_battle_net_token():
+    """Get a Battle.net API token using client credentials, shared by all workers until it expires"""
+    global _token, _token_expires_at
+    if _token and time.time() < _token_expires_at:
+        return _token
+
+    settings = get_settings()
+    if not settings.client_id or not settings.client_secret:
+        raise HTTPException(status_code=500, detail="Battle.net credentials not configured")
+
+    token = await get_cache().get_or_set(
+        'token:client-credentials',
+        _request_battle_net_token,
+        ttl=lambda token: token['expires_at'] - time.time(),
+    )
+    _token, _token_expires_at = token['access_token'], token['expires_at']
+    return _token
+
+async def get_user_profile(access_token: str) -> dict:
+    """Fetch the OAuth userinfo (id and battletag) for a user token"""
+    async def fetch():
+        profile_response = await get_client().get(
+            BATTLE_NET_USERINFO_URL,
+            headers={
+                'Authorization': f"Bearer {access_token}"
+            }
+        )
+        
+        if profile_response.status_code != 200:
+            raise HTTPException(status_code=profile_response.status_code, detail="Failed to get user profile")
+        
+        return profile_response.json()
+
+    # Key on a digest so raw user tokens never end up in a shared store
+    token_digest = hashlib.sha256(access_token.encode()).hexdigest()
+    return await get_cache().get_or_set(f"userinfo:{token_digest}", fetch, ttl=USERINFO_CACHE_TTL)
+
+async def get_character_section(url: str, namespace: str, access_token: str, required: bool = False) -> Optional[dict]:
+    """Fetch one character endpoint (profile, equipment, pvp-summary, ...) through the cache
+
+    Character data is public, so the cache key ignores whose token fetched it.
+    A failed optional section returns None and is retried on the next request;
+    a failed required section raises.
+    """
+    async def fetch():
+        response = await get_client().get(
+            url,
+            headers={
+                'Authorization': f"Bearer {access_token}"
+            },
+            params={
+                'namespace': namespace,
+                'locale': 'en_US'
+            }
+        )
+        if response.status_code == 200:
+            return response.json()
+        if required:
+            error_detail = f"Failed to fetch character profile: {response.text}"
+            print(f"Profile fetch error: {error_detail}") # Debug log
+            raise HTTPException(status_code=response.status_code, detail=error_detail)
+        return None
+
+    return await get_cache().get_or_set(f"character:{namespace}:{url}", fetch, ttl=CHARACTER_CACHE_TTL)
@@ -0,0 +1,131 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from ..config import get_settings
+from . import serialization
+from .base import CacheBackend
+
+# How long one worker may hold a fill lock before others stop waiting for it
+LOCK_TTL = 10.0
+LOCK_POLL_INTERVAL = 0.05
+
+class Cache:
+    """Serializing front end over a backend with single-flight fills
+
+    Concurrent misses for a key in one worker share one fill, and across
+    workers the backend lock lets one worker fill while the rest wait for
+    its result. Backend failures degrade to a miss rather than an error.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = await self.backend.get(key)
+            return None if raw is None else serialization.loads(raw)
+        except Exception as e:
+            print(f"Cache get failed for {key}: {str(e)}")
+            return None
+
+    async def set(self, key: str, value: Any, ttl: float):
+        try:
+            await self.backend.set(key, serialization.dumps(value), ttl)
+        except Exception as e:
+            print(f"Cache set failed for {key}: {str(e)}")
+
+    async def delete(self, key: str):
+        try:
+            await self.backend.delete(key)
+        except Exception as e:
+            print(f"Cache delete failed for {key}: {str(e)}")
+
+    async def get_or_set(
+        self,
+        key: str,
+        fill: Callable[[], Awaitable[Any]],
+        ttl: Union[float, Callable[[Any], float]],
+    ) -> Any:
+        """Return the cached value for key, calling fill once on a miss
+
+        ttl may be a function of the filled value. None results are not cached.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fill(key, fill, ttl))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        # Shield so one cancelled request doesn't cancel the fill others are waiting on
+        return await asyncio.shield(task)
+
+    async def _fill(self, key, fill, ttl):
+        token = await self._acquire_lock(key)
+        deadline = time.monotonic() + LOCK_TTL
+        while token is None and time.monotonic() < deadline:
+            # Another worker is filling this key; pick up its result when it lands
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            value = await self.get(key)
+            if value is not None:
+                return value
+            token = await self._acquire_lock(key)
+
+        try:
+            if token is not None:
+                value = await self.get(key)
+                if value is not None:
+                    return value
+            value = await fill()
+            if value is not None:
+                await self.set(key, value, ttl(value) if callable(ttl) else ttl)
+            return value
+        finally:
+            if token:
+                try:
+                    await self.backend.release_lock(key, token)
+                except Exception as e:
+                    print(f"Cache lock release failed for {key}: {str(e)}")
+
+    async def _acquire_lock(self, key: str) -> Optional[str]:
+        try:
+            return await self.backend.acquire_lock(key, LOCK_TTL)
+        except Exception as e:
+            # Fill without the lock rather than stall on an unreachable backend
+            print(f"Cache lock failed for {key}: {str(e)}")
+            return ''
+
+    async def close(self):
+        await self.backend.close()
+
+_cache: Optional[Cache] = None
+
+def create_backend() -> CacheBackend:
+    settings = get_settings()
+    if settings.cache_backend == 'memory':
+        from .memory import MemoryCache
+        return MemoryCache(max_entries=settings.cache_max_entries)
+    if settings.cache_backend == 'shm':
+        from .shm import SharedMemoryCache
+        return SharedMemoryCache(directory=settings.cache_dir)
+    if settings.cache_backend == 'redis':
+        from .redis_store import RedisCache
+        return RedisCache(url=settings.cache_url, timeout=settings.cache_timeout)
+    raise ValueError(f"Unknown CACHE_BACKEND: {settings.cache_backend}")
+
+def get_cache() -> Cache:
+    """Return this worker's cache, built from settings on first use"""
+    global _cache
+    if _cache is None:
+        _cache = Cache(create_backend())
+    return _cache
+
+async def close_cache():
+    global _cache
+    if _cache is not None:
+        await _cache.close()
+        _cache = None
@@ -0,0 +1,28 @@
+import secrets
+from typing import Optional
+
+class CacheBackend:
+    """Byte store shared by the Cache front end; values are already serialized"""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        raise NotImplementedError
+
+    async def delete(self, key: str):
+        raise NotImplementedError
+
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        """Try to take the fill lock for key; return a release token, or None if held elsewhere"""
+        raise NotImplementedError
+
+    async def release_lock(self, key: str, token: str):
+        """Release the fill lock, but only if it is still ours"""
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+def new_lock_token() -> str:
+    return secrets.token_hex(8)
@@ -0,0 +1,47 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from .base import CacheBackend, new_lock_token
+
+class MemoryCache(CacheBackend):
+    """In-process LRU; each worker keeps its own copy"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._locks: Dict[str, Tuple[str, float]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        now = time.monotonic()
+        held = self._locks.get(key)
+        if held is not None and held[1] > now:
+            return None
+        token = new_lock_token()
+        self._locks[key] = (token, now + ttl)
+        return token
+
+    async def release_lock(self, key: str, token: str):
+        held = self._locks.get(key)
+        if held is not None and held[0] == token:
+            del self._locks[key]
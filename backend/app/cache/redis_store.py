@@ -0,0 +1,120 @@
+import asyncio
+from typing import List, Optional, Union
+from urllib.parse import urlparse
+
+from .base import CacheBackend, new_lock_token
+
+# Delete the lock only if it still holds our token
+RELEASE_SCRIPT = "if redis.call('get', KEYS[1]) == ARGV[1] then return redis.call('del', KEYS[1]) else return 0 end"
+
+class RedisError(Exception):
+    pass
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *args: Union[str, bytes, int]):
+        out = [b'*%d\r\n' % len(args)]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode()
+            elif isinstance(arg, int):
+                arg = str(arg).encode()
+            out.append(b'$%d\r\n%s\r\n' % (len(arg), arg))
+        self.writer.write(b''.join(out))
+        await self.writer.drain()
+        return await self._read_reply()
+
+    async def _read_reply(self):
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("Cache server closed the connection")
+        kind, body = line[:1], line[1:-2]
+        if kind == b'+':
+            return body
+        if kind == b'-':
+            raise RedisError(body.decode())
+        if kind == b':':
+            return int(body)
+        if kind == b'$':
+            length = int(body)
+            if length == -1:
+                return None
+            data = await self.reader.readexactly(length + 2)
+            return data[:-2]
+        if kind == b'*':
+            length = int(body)
+            if length == -1:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected reply: {line!r}")
+
+    def close(self):
+        self.writer.close()
+
+class RedisCache(CacheBackend):
+    """Store shared across hosts, spoken over the Redis protocol (RESP)
+
+    Works against Redis or anything that speaks RESP and supports SET NX PX
+    and EVAL. Connections are pooled; a connection that errors, times out or
+    is cancelled mid-command is closed rather than returned to the pool.
+    """
+
+    def __init__(self, url: str = 'redis://localhost:6379/0', pool_size: int = 10, prefix: str = 'arenameta:', timeout: float = 1.0):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.prefix = prefix
+        self.timeout = timeout
+        self._pool: List[_Connection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        conn = _Connection(reader, writer)
+        try:
+            if self.password:
+                await asyncio.wait_for(conn.execute('AUTH', self.password), self.timeout)
+            if self.db:
+                await asyncio.wait_for(conn.execute('SELECT', self.db), self.timeout)
+        except BaseException:
+            conn.close()
+            raise
+        return conn
+
+    async def execute(self, *args):
+        async with self._slots:
+            conn = self._pool.pop() if self._pool else await self._connect()
+            try:
+                reply = await asyncio.wait_for(conn.execute(*args), self.timeout)
+            except BaseException:
+                # The reply may be half read; never hand this socket out again
+                conn.close()
+                raise
+            self._pool.append(conn)
+            return reply
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.execute('GET', self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        await self.execute('SET', self.prefix + key, value, 'PX', max(int(ttl * 1000), 1))
+
+    async def delete(self, key: str):
+        await self.execute('DEL', self.prefix + key)
+
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        token = new_lock_token()
+        reply = await self.execute('SET', f"{self.prefix}lock:{key}", token, 'NX', 'PX', max(int(ttl * 1000), 1))
+        return token if reply == b'OK' else None
+
+    async def release_lock(self, key: str, token: str):
+        await self.execute('EVAL', RELEASE_SCRIPT, 1, f"{self.prefix}lock:{key}", token)
+
+    async def close(self):
+        while self._pool:
+            self._pool.pop().close()
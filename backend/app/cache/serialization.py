@@ -0,0 +1,34 @@
+import json
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One tag byte in front of each payload so workers can read what others wrote
+MSGPACK = b'm'
+ORJSON = b'o'
+JSON = b'j'
+
+def dumps(value) -> bytes:
+    """Serialize with the most compact codec installed: msgpack, then orjson, then json"""
+    if msgpack is not None:
+        return MSGPACK + msgpack.packb(value, use_bin_type=True)
+    if orjson is not None:
+        return ORJSON + orjson.dumps(value)
+    return JSON + json.dumps(value, separators=(',', ':')).encode()
+
+def loads(data: bytes):
+    tag, payload = data[:1], data[1:]
+    if tag == MSGPACK and msgpack is not None:
+        return msgpack.unpackb(payload, raw=False)
+    if tag == ORJSON:
+        return orjson.loads(payload) if orjson is not None else json.loads(payload)
+    if tag == JSON:
+        return json.loads(payload)
+    raise ValueError(f"Unreadable cache payload format: {tag!r}")
@@ -0,0 +1,120 @@
+import fcntl
+import hashlib
+import os
+import struct
+import tempfile
+import time
+from typing import Dict, Optional
+
+from .base import CacheBackend, new_lock_token
+
+# Entries start with their wall-clock expiry so every worker agrees on it
+HEADER = struct.Struct('<d')
+PRUNE_EVERY = 1000
+# Fill locks hash into this many fixed lock files, so lock files never pile up
+LOCK_STRIPES = 256
+# Temp files older than this were left by a worker that died mid-write
+STALE_TMP_AGE = 60
+
+def default_directory() -> str:
+    base = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(base, 'arenameta-cache')
+
+class SharedMemoryCache(CacheBackend):
+    """Store shared by workers on the same host, one file per key on tmpfs
+
+    Writes go through a temp file and rename, so readers never see a partial
+    entry. Fill locks are flock()s on one of LOCK_STRIPES files, which the
+    kernel drops if a worker dies; keys sharing a stripe just wait on each
+    other briefly.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory or default_directory()
+        os.makedirs(self.directory, exist_ok=True)
+        self._held: Dict[str, int] = {}
+        self._sets = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode()).hexdigest())
+
+    def _lock_path(self, key: str) -> str:
+        stripe = hashlib.sha1(key.encode()).digest()[0] % LOCK_STRIPES
+        return os.path.join(self.directory, f"stripe-{stripe:03d}.lock")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < HEADER.size:
+            return None
+        (expires_at,) = HEADER.unpack_from(data)
+        if time.time() >= expires_at:
+            self._unlink(path)
+            return None
+        return data[HEADER.size:]
+
+    async def set(self, key: str, value: bytes, ttl: float):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(HEADER.pack(time.time() + ttl))
+            f.write(value)
+        os.replace(tmp_path, self._path(key))
+
+        self._sets += 1
+        if self._sets % PRUNE_EVERY == 0:
+            self.prune()
+
+    async def delete(self, key: str):
+        self._unlink(self._path(key))
+
+    async def acquire_lock(self, key: str, ttl: float) -> Optional[str]:
+        fd = os.open(self._lock_path(key), os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return None
+        token = new_lock_token()
+        self._held[token] = fd
+        return token
+
+    async def release_lock(self, key: str, token: str):
+        fd = self._held.pop(token, None)
+        if fd is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def prune(self):
+        """Remove expired entries and temp files left behind by dead writers"""
+        now = time.time()
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.tmp'):
+                try:
+                    if now - entry.stat().st_mtime > STALE_TMP_AGE:
+                        self._unlink(entry.path)
+                except FileNotFoundError:
+                    pass
+                continue
+            if '.' in entry.name:
+                continue
+            try:
+                with open(entry.path, 'rb') as f:
+                    header = f.read(HEADER.size)
+            except FileNotFoundError:
+                continue
+            if len(header) == HEADER.size and HEADER.unpack(header)[0] <= now:
+                self._unlink(entry.path)
+
+    async def close(self):
+        for token in list(self._held):
+            await self.release_lock('', token)
+
+    def _unlink(self, path: str):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,89 @@
+import os
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from dotenv import load_dotenv
+
+class GameVersion(str, Enum):
+    RETAIL = "retail"
+    CLASSIC = "classic"
+
+# Battle.net OAuth configuration
+BATTLE_NET_AUTH_URL = 'https://oauth.battle.net/authorize'
+BATTLE_NET_TOKEN_URL = 'https://oauth.battle.net/token'
+BATTLE_NET_API_URL = 'https://us.api.blizzard.com'
+BATTLE_NET_USERINFO_URL = 'https://us.battle.net/oauth/userinfo'
+BATTLE_NET_REGION = 'us'
+BATTLE_NET_SCOPE = 'wow.profile openid'
+
+# Namespace configuration
+NAMESPACES = {
+    GameVersion.RETAIL: 'profile-us',
+    GameVersion.CLASSIC: 'profile-classic-us'
+}
+
+# Dynamic namespace configuration for game data
+DYNAMIC_NAMESPACES = {
+    GameVersion.RETAIL: 'dynamic-us',
+    GameVersion.CLASSIC: 'dynamic-classic-us'
+}
+
+# Static namespace configuration for game data that only changes with patches
+STATIC_NAMESPACES = {
+    GameVersion.RETAIL: 'static-us',
+    GameVersion.CLASSIC: 'static-classic-us'
+}
+
+# Season configuration
+SEASONS = {
+    GameVersion.RETAIL: 33,
+    GameVersion.CLASSIC: 1
+}
+
+BRACKETS = ('2v2', '3v3', '5v5')
+
+# Cache lifetimes, in seconds
+USERINFO_CACHE_TTL = 300
+CHARACTER_CACHE_TTL = 300
+ITEM_CACHE_TTL = 86400
+# Stored static items older than this are refetched, picking up patch changes
+ITEM_REFRESH_AGE = 7 * 86400
+
+@dataclass(frozen=True)
+class Settings:
+    database_url: str
+    client_id: Optional[str]
+    client_secret: Optional[str]
+    redirect_uri: str
+    cors_origins: Tuple[str, ...]
+    snapshot_dir: str
+    leaderboard_ttl: int
+    http_timeout: float
+    cache_backend: str
+    cache_url: str
+    cache_dir: Optional[str]
+    cache_max_entries: int
+    cache_timeout: float
+
+@lru_cache()
+def get_settings() -> Settings:
+    """Read the environment (and .env) once per process"""
+    load_dotenv()
+    origins = os.getenv('CORS_ORIGINS', 'http://localhost:3000')
+    return Settings(
+        database_url=os.getenv('DATABASE_URL', 'sqlite:///./arenameta.db'),
+        client_id=os.getenv('BATTLE_NET_CLIENT_ID'),
+        client_secret=os.getenv('BATTLE_NET_CLIENT_SECRET'),
+        redirect_uri=os.getenv('BATTLE_NET_REDIRECT_URI', 'http://localhost:3000/auth/callback'),
+        cors_origins=tuple(origin.strip() for origin in origins.split(',') if origin.strip()),
+        snapshot_dir=os.getenv('SNAPSHOT_DIR', './snapshots'),
+        leaderboard_ttl=int(os.getenv('LEADERBOARD_TTL', '300')),
+        http_timeout=float(os.getenv('HTTP_TIMEOUT', '10')),
+        cache_backend=os.getenv('CACHE_BACKEND', 'memory'),
+        cache_url=os.getenv('CACHE_URL', 'redis://localhost:6379/0'),
+        cache_dir=os.getenv('CACHE_DIR'),
+        cache_max_entries=int(os.getenv('CACHE_MAX_ENTRIES', '10000')),
+        cache_timeout=float(os.getenv('CACHE_TIMEOUT', '1')),
+    )
@@ -0,0 +1,63 @@
+from functools import lru_cache
+
+from sqlalchemy import create_engine, Column, String, Boolean, Integer, Float, Text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+
+from .config import get_settings
+
+Base = declarative_base()
+
+# Database models
+class MainCharacter(Base):
+    __tablename__ = "main_characters"
+
+    id = Column(String, primary_key=True)  # Battle.net account ID
+    battletag = Column(String)
+    realm = Column(String)
+    name = Column(String)
+    game_version = Column(String)
+    is_main = Column(Boolean, default=True)
+
+class SocialLinks(Base):
+    __tablename__ = "social_links"
+
+    battletag = Column(String, primary_key=True)
+    discord = Column(String, nullable=True)
+    twitch = Column(String, nullable=True)
+    twitter = Column(String, nullable=True)
+    youtube = Column(String, nullable=True)
+    instagram = Column(String, nullable=True)
+
+class StaticItem(Base):
+    __tablename__ = "static_items"
+
+    namespace = Column(String, primary_key=True)  # e.g. static-us
+    item_id = Column(Integer, primary_key=True)
+    data = Column(Text)  # JSON summary of the item and its icon
+    fetched_at = Column(Float)
+
+@lru_cache()
+def get_engine():
+    """Create the engine on first use instead of at import time"""
+    database_url = get_settings().database_url
+    connect_args = {'check_same_thread': False} if database_url.startswith('sqlite') else {}
+    return create_engine(database_url, connect_args=connect_args, pool_pre_ping=True)
+
+@lru_cache()
+def _session_factory():
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
+def SessionLocal():
+    return _session_factory()()
+
+def init_db():
+    """Create tables; safe to call from several workers starting at once"""
+    engine = get_engine()
+    try:
+        Base.metadata.create_all(bind=engine)
+    except OperationalError:
+        # Another worker created the tables between our existence check and
+        # CREATE TABLE; a second pass sees them and becomes a no-op.
+        Base.metadata.create_all(bind=engine)
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import time
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from .blizzard import get_battle_net_token, get_client
+from .cache import get_cache
+from .config import BATTLE_NET_API_URL, GameVersion, ITEM_CACHE_TTL, ITEM_REFRESH_AGE, STATIC_NAMESPACES
+from .database import SessionLocal, StaticItem
+
+# Items fetched at once per get_items call; each fetch is two requests (item and media)
+ITEM_FETCH_CONCURRENCY = 4
+
+# (namespace, item id) -> (fetched_at, item summary); static data only changes with patches
+_items: Dict[tuple, tuple] = {}
+
+def _name(value) -> Optional[str]:
+    if isinstance(value, dict):
+        return value.get('name') or value.get('type')
+    return value
+
+def _summarize(item: dict, media: Optional[dict]) -> dict:
+    """Keep the parts of the static item and media documents the gear view needs"""
+    icon = None
+    for asset in (media or {}).get('assets', []):
+        if asset.get('key') == 'icon':
+            icon = asset.get('value')
+    return {
+        'id': item.get('id'),
+        'name': item.get('name'),
+        'quality': _name(item.get('quality')),
+        'level': item.get('level'),
+        'required_level': item.get('required_level'),
+        'item_class': _name(item.get('item_class')),
+        'item_subclass': _name(item.get('item_subclass')),
+        'inventory_type': _name(item.get('inventory_type')),
+        'stats': item.get('preview_item', {}).get('stats', []),
+        'icon': icon,
+    }
+
+def _load_stored(namespace: str, item_ids: Iterable[int]) -> Dict[int, tuple]:
+    """Stored summaries younger than ITEM_REFRESH_AGE; older rows are refetched so patches show up"""
+    db = SessionLocal()
+    try:
+        rows = db.query(StaticItem).filter(
+            StaticItem.namespace == namespace,
+            StaticItem.item_id.in_(list(item_ids)),
+            StaticItem.fetched_at >= time.time() - ITEM_REFRESH_AGE
+        ).all()
+        return {row.item_id: (row.fetched_at, json.loads(row.data)) for row in rows}
+    finally:
+        db.close()
+
+def _store(namespace: str, summaries: Dict[int, dict]):
+    """Persist freshly fetched summaries in one transaction"""
+    fetched_at = time.time()
+    db = SessionLocal()
+    try:
+        for item_id, summary in summaries.items():
+            db.merge(StaticItem(namespace=namespace, item_id=item_id, data=json.dumps(summary), fetched_at=fetched_at))
+        db.commit()
+    except SQLAlchemyError as e:
+        # e.g. another worker stored them first or holds the SQLite write lock;
+        # the summaries are still good, they just get persisted on a later miss
+        db.rollback()
+        print(f"Could not store {len(summaries)} items: {str(e)}") # Debug log
+    finally:
+        db.close()
+
+async def _fetch_item(namespace: str, item_id: int, slots: asyncio.Semaphore) -> Optional[dict]:
+    """Fetch an item and its media from Battle.net and summarize it"""
+    token = await get_battle_net_token()
+    client = get_client()
+    headers = {'Authorization': f"Bearer {token}"}
+    params = {'namespace': namespace, 'locale': 'en_US'}
+
+    async with slots:
+        item_response, media_response = await asyncio.gather(
+            client.get(f"{BATTLE_NET_API_URL}/data/wow/item/{item_id}", headers=headers, params=params),
+            client.get(f"{BATTLE_NET_API_URL}/data/wow/media/item/{item_id}", headers=headers, params=params),
+        )
+
+    # Items without an icon are stored as such; any other failure is retried next time
+    if item_response.status_code != 200 or media_response.status_code not in (200, 404):
+        print(f"Item {item_id} fetch failed: {item_response.status_code}/{media_response.status_code}") # Debug log
+        return None
+
+    media = media_response.json() if media_response.status_code == 200 else None
+    return _summarize(item_response.json(), media)
+
+async def get_items(game_version: GameVersion, item_ids: Iterable[int]) -> Dict[int, dict]:
+    """Look up static item summaries: memory, then the database, then Battle.net for the rest
+
+    Database reads and writes are batched per call and run in a worker thread.
+    """
+    namespace = STATIC_NAMESPACES[game_version]
+    now = time.time()
+    found = {}
+    missing = set()
+    for item_id in item_ids:
+        entry = _items.get((namespace, item_id))
+        if entry is not None and now - entry[0] < ITEM_REFRESH_AGE:
+            found[item_id] = entry[1]
+        else:
+            missing.add(item_id)
+
+    if missing:
+        stored = await asyncio.to_thread(_load_stored, namespace, missing)
+        for item_id, entry in stored.items():
+            _items[(namespace, item_id)] = entry
+            found[item_id] = entry[1]
+            missing.discard(item_id)
+
+    if missing:
+        # The shared cache makes one worker fetch each item while the others wait for it
+        cache = get_cache()
+        slots = asyncio.Semaphore(ITEM_FETCH_CONCURRENCY)
+        ordered = sorted(missing)
+        summaries = await asyncio.gather(
+            *[
+                cache.get_or_set(f"item:{namespace}:{item_id}", lambda item_id=item_id: _fetch_item(namespace, item_id, slots), ttl=ITEM_CACHE_TTL)
+                for item_id in ordered
+            ],
+            return_exceptions=True
+        )
+        fetched = {}
+        for item_id, summary in zip(ordered, summaries):
+            if isinstance(summary, Exception):
+                print(f"Item {item_id} lookup failed: {str(summary)}") # Debug log
+            elif summary is not None:
+                _items[(namespace, item_id)] = (now, summary)
+                fetched[item_id] = summary
+        if fetched:
+            # Summaries served by another worker's fill are stored again here; merge makes that harmless
+            await asyncio.to_thread(_store, namespace, fetched)
+        found.update(fetched)
+
+    return found
+
+async def enrich_equipment(equipment: Optional[dict], game_version: GameVersion) -> Optional[dict]:
+    """Attach icon, item level and base stats from static data to each equipped item"""
+    if not equipment or not equipment.get('equipped_items'):
+        return equipment
+
+    equipped_items = equipment['equipped_items']
+    item_ids = {equipped['item']['id'] for equipped in equipped_items if equipped.get('item', {}).get('id')}
+    items = await get_items(game_version, item_ids)
+
+    enriched = []
+    for equipped in equipped_items:
+        summary = items.get(equipped.get('item', {}).get('id'))
+        if summary is None:
+            enriched.append(equipped)
+        else:
+            enriched.append({**equipped, 'icon': summary['icon'], 'static_item': summary})
+    return {**equipment, 'equipped_items': enriched}
@@ -1,23 +1,62 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from .routes import auth, leaderboard, character
-
-app = FastAPI()
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000"],  # Frontend URL
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Include routers
-app.include_router(auth.router)
-app.include_router(leaderboard.router)
-app.include_router(character.router)
-
-@app.get("/")
-async def root():
-    return {"message": "ArenaMeta API"} 
\ No newline at end of file
+
+from . import blizzard, matching, snapshots
+from .cache import close_cache, get_cache
+from .config import get_settings
+from .database import init_db
+from .routes import account, auth, character, leaderboard, partners, social
+
+async def warm_up():
+    """Prefetch the client credentials token so the first request doesn't pay for it"""
+    try:
+        await blizzard.get_battle_net_token()
+    except HTTPException as e:
+        print(f"Skipping token prefetch: {e.detail}")
+    except Exception as e:
+        print(f"Token prefetch failed: {str(e)}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each worker runs this on start; every step is idempotent and cheap
+    init_db()
+    loaded = await asyncio.to_thread(snapshots.load_leaderboards)
+    print(f"Loaded {loaded} leaderboard snapshots")
+    await matching.get_partner_index()
+    blizzard.get_client()
+    get_cache()
+
+    # Warm-up runs in the background so the worker starts accepting requests immediately
+    warm_up_task = asyncio.create_task(warm_up())
+    try:
+        yield
+    finally:
+        warm_up_task.cancel()
+        await blizzard.close_client()
+        await close_cache()
+
+def create_app() -> FastAPI:
+    settings = get_settings()
+    app = FastAPI(lifespan=lifespan)
+
+    # Configure CORS
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=list(settings.cors_origins),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    # Include routers
+    for routes in (auth, account, character, leaderboard, partners, social):
+        app.include_router(routes.router)
+
+    @app.get("/")
+    async def root():
+        return {"message": "WoW Classic Armory API is running"}
+
+    return app
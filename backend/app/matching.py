@@ -0,0 +1,184 @@
+import asyncio
+import heapq
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import snapshots
+from .config import BATTLE_NET_REGION, BRACKETS, GameVersion, SEASONS
+
+# Ranking: candidates are ordered by penalty, lower is better. The penalty is
+# the rating gap minus bonuses, so bonuses are worth this many rating points.
+SAME_REALM_BONUS = 50
+ACTIVITY_BONUS_PER_GAME = 5
+ACTIVITY_BONUS_CAP = 100
+MAX_BONUS = SAME_REALM_BONUS + ACTIVITY_BONUS_CAP
+
+class Player(NamedTuple):
+    name: str
+    realm: str
+    realm_slug: str
+    faction: str
+    rating: int
+    rank: int
+    bracket: str
+    region: str
+    won: int
+    lost: int
+    played: int
+    recent_games: int
+
+class Bucket:
+    """Players for one (game version, region, bracket), sorted by rating"""
+
+    __slots__ = ('fetched_at', 'ratings', 'players')
+
+    def __init__(self, fetched_at: float, players: List[Player]):
+        players.sort(key=lambda player: player.rating)
+        self.fetched_at = fetched_at
+        self.ratings = [player.rating for player in players]
+        self.players = players
+
+def _name(value) -> Optional[str]:
+    """Leaderboard references are either plain names or {'name': ..., 'id': ...}"""
+    if isinstance(value, dict):
+        value = value.get('name')
+    return value if isinstance(value, str) else None
+
+def _player_from_entry(entry: dict, bracket: str, previous_played: Dict[str, int]) -> Player:
+    character = entry.get('character', {})
+    realm = character.get('realm', {})
+    stats = entry.get('season_match_statistics', {})
+    played = stats.get('played', 0)
+    key = snapshots.character_key(entry)
+    # Games since the activity baseline; characters new to the board count as inactive
+    recent_games = max(played - previous_played[key], 0) if key in previous_played else 0
+    return Player(
+        name=character.get('name', ''),
+        realm=_name(realm) or realm.get('slug', ''),
+        realm_slug=realm.get('slug', ''),
+        faction=entry.get('faction', {}).get('type', ''),
+        rating=entry.get('rating', 0),
+        rank=entry.get('rank', 0),
+        bracket=bracket,
+        region=BATTLE_NET_REGION,
+        won=stats.get('won', 0),
+        lost=stats.get('lost', 0),
+        played=played,
+        recent_games=recent_games,
+    )
+
+def _penalty(player: Player, rating: int, realm: Optional[str]) -> int:
+    bonus = min(player.recent_games * ACTIVITY_BONUS_PER_GAME, ACTIVITY_BONUS_CAP)
+    if realm and player.realm_slug == realm:
+        bonus += SAME_REALM_BONUS
+    return abs(player.rating - rating) - bonus
+
+class PartnerIndex:
+    """Leaderboard players bucketed for fast nearest-rating partner queries
+
+    Only the configured region (BATTLE_NET_REGION) is indexed, since that is
+    the only region whose leaderboards the backend fetches.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, str, str], Bucket] = {}
+        self._sync_lock = threading.Lock()
+
+    def sync(self):
+        """Rebuild buckets whose leaderboard snapshot changed since they were built
+
+        Rebuilding a bucket walks the whole leaderboard; this runs in a worker
+        thread and swaps finished buckets in, so queries never see a partial one.
+        """
+        with self._sync_lock:
+            self._sync()
+
+    def _sync(self):
+        for game_version, season in SEASONS.items():
+            for bracket in BRACKETS:
+                snapshot = snapshots.get_snapshot(game_version, season, bracket)
+                if snapshot is None:
+                    continue
+                key = (game_version.value, BATTLE_NET_REGION, bracket)
+                bucket = self._buckets.get(key)
+                if bucket is not None and bucket.fetched_at >= snapshot['fetched_at']:
+                    continue
+                baseline = snapshots.activity_baseline(snapshot)
+                previous_played = baseline['played'] if baseline else {}
+                players = [
+                    _player_from_entry(entry, bracket, previous_played)
+                    for entry in snapshot['data'].get('entries', [])
+                ]
+                self._buckets[key] = Bucket(snapshot['fetched_at'], players)
+
+    def has_bucket(self, game_version: GameVersion, bracket: str) -> bool:
+        return (game_version.value, BATTLE_NET_REGION, bracket) in self._buckets
+
+    def _candidates(self, bucket: Bucket, rating: int, max_rating_diff: int) -> Iterable[Player]:
+        """Walk outward from the target rating, nearest players first"""
+        ratings, players = bucket.ratings, bucket.players
+        right = bisect_left(ratings, rating)
+        left = right - 1
+        while left >= 0 or right < len(ratings):
+            if right >= len(ratings) or (left >= 0 and rating - ratings[left] <= ratings[right] - rating):
+                index, left = left, left - 1
+            else:
+                index, right = right, right + 1
+            if abs(ratings[index] - rating) > max_rating_diff:
+                return
+            yield players[index]
+
+    def find_partners(
+        self,
+        game_version: GameVersion,
+        rating: int,
+        bracket: Optional[str] = None,
+        faction: Optional[str] = None,
+        realm: Optional[str] = None,
+        exclude: Optional[str] = None,
+        limit: int = 20,
+        max_rating_diff: int = 300,
+    ) -> List[Tuple[int, Player]]:
+        """Return up to limit (penalty, player) pairs, best match first
+
+        Each bucket is scanned outward from the target rating and stops once
+        no remaining player could beat the current top-k, so a query touches
+        roughly limit players per bucket rather than the whole leaderboard.
+        """
+        faction = faction.upper() if faction else None
+        brackets = (bracket,) if bracket else BRACKETS
+
+        # Max-heap on penalty (negated) holding the best `limit` so far
+        top: List[Tuple[int, int, Player]] = []
+        seq = 0
+        for bucket_bracket in brackets:
+            bucket = self._buckets.get((game_version.value, BATTLE_NET_REGION, bucket_bracket))
+            if bucket is None:
+                continue
+            for player in self._candidates(bucket, rating, max_rating_diff):
+                if len(top) == limit and abs(player.rating - rating) - MAX_BONUS >= -top[0][0]:
+                    break
+                if faction and player.faction != faction:
+                    continue
+                if exclude and f"{player.realm_slug}/{player.name.lower()}" == exclude:
+                    continue
+                penalty = _penalty(player, rating, realm)
+                seq += 1
+                if len(top) < limit:
+                    heapq.heappush(top, (-penalty, seq, player))
+                elif penalty < -top[0][0]:
+                    heapq.heapreplace(top, (-penalty, seq, player))
+
+        return sorted(((-negated, player) for negated, _, player in top), key=lambda match: match[0])
+
+_index = PartnerIndex()
+
+def _refresh_index():
+    snapshots.load_leaderboards()
+    _index.sync()
+
+async def get_partner_index() -> PartnerIndex:
+    """Return this worker's index, refreshed off the event loop from any snapshots that changed"""
+    await asyncio.to_thread(_refresh_index)
+    return _index
@@ -0,0 +1,66 @@
+from fastapi import APIRouter, HTTPException, Request
+import httpx
+
+from ..blizzard import get_access_token, get_client
+from ..config import BATTLE_NET_API_URL, GameVersion, NAMESPACES
+
+router = APIRouter()
+
+@router.get('/api/account/profile')
+async def get_account_profile(req: Request):
+    """Get account profile and character list for both retail and classic"""
+    access_token = get_access_token(req)
+
+    try:
+        client = get_client()
+
+        # Get retail profile
+        retail_response = await client.get(
+            f"{BATTLE_NET_API_URL}/profile/user/wow",
+            headers={
+                'Authorization': f"Bearer {access_token}"
+            },
+            params={
+                'namespace': NAMESPACES[GameVersion.RETAIL],
+                'locale': 'en_US'
+            }
+        )
+        
+        if retail_response.status_code != 200:
+            print(f"Retail profile fetch error: {retail_response.text}") # Debug log
+            retail_data = None
+        else:
+            retail_data = retail_response.json()
+            print(f"Retail profile data received: {retail_data}") # Debug log
+
+        # Get classic profile
+        classic_response = await client.get(
+            f"{BATTLE_NET_API_URL}/profile/user/wow",
+            headers={
+                'Authorization': f"Bearer {access_token}"
+            },
+            params={
+                'namespace': NAMESPACES[GameVersion.CLASSIC],
+                'locale': 'en_US'
+            }
+        )
+        
+        if classic_response.status_code != 200:
+            print(f"Classic profile fetch error: {classic_response.text}") # Debug log
+            classic_data = None
+        else:
+            classic_data = classic_response.json()
+            print(f"Classic profile data received: {classic_data}") # Debug log
+
+        return {
+            'retail': retail_data,
+            'classic': classic_data
+        }
+    except httpx.HTTPError as e:
+        error_detail = f"HTTP error occurred: {str(e)}"
+        print(f"HTTP error: {error_detail}") # Debug log
+        raise HTTPException(status_code=500, detail=error_detail)
+    except Exception as e:
+        error_detail = f"Unexpected error: {str(e)}"
+        print(f"Unexpected error: {error_detail}") # Debug log
+        raise HTTPException(status_code=500, detail=error_detail)
@@ -0,0 +1,96 @@
+from fastapi import APIRouter, HTTPException
+import httpx
+
+from ..blizzard import get_client
+from ..config import (
+    BATTLE_NET_AUTH_URL,
+    BATTLE_NET_SCOPE,
+    BATTLE_NET_TOKEN_URL,
+    BATTLE_NET_USERINFO_URL,
+    get_settings,
+)
+from ..schemas import OAuthCallback, OAuthRequest
+
+router = APIRouter()
+
+@router.post('/api/auth/battlenet')
+async def get_battlenet_auth_url(request: OAuthRequest):
+    settings = get_settings()
+    if not settings.client_id:
+        raise HTTPException(status_code=500, detail="Battle.net client ID not configured")
+    
+    auth_url = f"{BATTLE_NET_AUTH_URL}?client_id={settings.client_id}&redirect_uri={settings.redirect_uri}&response_type=code&state={request.state}&scope={BATTLE_NET_SCOPE}"
+    return {"url": auth_url}
+
+@router.post('/api/auth/battlenet/callback')
+async def handle_battlenet_callback(callback: OAuthCallback):
+    settings = get_settings()
+    if not settings.client_id or not settings.client_secret:
+        raise HTTPException(status_code=500, detail="Battle.net credentials not configured")
+    
+    try:
+        client = get_client()
+
+        # Exchange code for access token
+        print(f"Exchanging code for token with redirect URI: {settings.redirect_uri}")
+        token_response = await client.post(
+            BATTLE_NET_TOKEN_URL,
+            data={
+                'grant_type': 'authorization_code',
+                'client_id': settings.client_id,
+                'client_secret': settings.client_secret,
+                'code': callback.code,
+                'redirect_uri': settings.redirect_uri,
+                'scope': BATTLE_NET_SCOPE
+            }
+        )
+        
+        if token_response.status_code != 200:
+            error_detail = f"Token exchange failed: {token_response.text}"
+            print(error_detail)
+            raise HTTPException(status_code=token_response.status_code, detail=error_detail)
+        
+        token_data = token_response.json()
+        
+        if 'access_token' not in token_data:
+            error_detail = "No access token in response"
+            print(error_detail)
+            raise HTTPException(status_code=400, detail=error_detail)
+        
+        # Get user profile
+        print("Fetching user profile...")
+        profile_response = await client.get(
+            BATTLE_NET_USERINFO_URL,
+            headers={
+                'Authorization': f"Bearer {token_data['access_token']}"
+            }
+        )
+        
+        if profile_response.status_code != 200:
+            error_detail = f"Profile fetch failed: {profile_response.text}"
+            print(error_detail)
+            raise HTTPException(status_code=profile_response.status_code, detail=error_detail)
+        
+        profile_data = profile_response.json()
+        print(f"Successfully authenticated user: {profile_data}")
+        
+        # Extract battletag from the profile data
+        battletag = profile_data.get('battletag')
+        if not battletag:
+            raise HTTPException(status_code=400, detail="No battletag found in profile data")
+        
+        return {
+            'access_token': token_data['access_token'],
+            'profile': {
+                'id': profile_data.get('id'),
+                'battletag': battletag
+            }
+        }
+    except httpx.HTTPError as e:
+        error_detail = f"HTTP error occurred: {str(e)}"
+        print(error_detail)
+        raise HTTPException(status_code=500, detail=error_detail)
+    except Exception as e:
+        error_detail = f"Unexpected error: {str(e)}"
+        print(error_detail)
+        raise HTTPException(status_code=500, detail=error_detail)
@@ -1,78 +1,149 @@
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.security import OAuth2PasswordBearer
-from typing import Optional
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request
 import httpx
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
+from ..blizzard import get_access_token, get_character_section, get_user_profile
+from ..config import BATTLE_NET_API_URL, NAMESPACES
+from ..database import MainCharacter, SessionLocal
+from ..items import enrich_equipment
+from ..schemas import CharacterRequest, SetMainCharacterRequest
 
 router = APIRouter()
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-async def get_blizzard_token():
-    """Get a Blizzard API access token using client credentials."""
-    client_id = os.getenv("BLIZZARD_CLIENT_ID")
-    client_secret = os.getenv("BLIZZARD_CLIENT_SECRET")
-    
-    if not client_id or not client_secret:
-        raise HTTPException(status_code=500, detail="Blizzard API credentials not configured")
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "https://us.battle.net/oauth/token",
-            data={
-                "grant_type": "client_credentials",
-                "client_id": client_id,
-                "client_secret": client_secret
-            }
-        )
-        
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail="Failed to get Blizzard token")
-        
-        return response.json()["access_token"]
+@router.post('/api/character')
+async def get_character_info(request: CharacterRequest, req: Request):
+    """Get character information for both retail and classic"""
+    access_token = get_access_token(req)
 
-@router.get("/api/character/{region}/{realm}/{name}")
-async def get_character(
-    region: str,
-    realm: str,
-    name: str,
-    game_version: str = "retail",
-    token: str = Depends(oauth2_scheme)
-):
-    """Get character data from Blizzard API."""
     try:
-        # Get Blizzard API token
-        blizzard_token = await get_blizzard_token()
+        namespace = NAMESPACES[request.game_version]
+        
+        # Format realm and character name
+        realm_slug = request.realm.lower()
+        character_name = request.name.lower()
         
-        # Determine namespace based on game version
-        namespace = "profile-us" if game_version == "retail" else "profile-classic-us"
+        # Construct the base URL with proper formatting
+        base_url = f"{BATTLE_NET_API_URL}/profile/wow/character/{realm_slug}/{character_name}"
+        print(f"Fetching character data from: {base_url}") # Debug log
         
-        # Construct the Blizzard API URL
-        url = f"https://{region}.api.blizzard.com/profile/wow/character/{realm}/{name}"
+        # Get character profile, equipment, PvP stats and media (avatar) concurrently
+        profile_data, equipment_data, pvp_data, media_data = await asyncio.gather(
+            get_character_section(base_url, namespace, access_token, required=True),
+            get_character_section(f"{base_url}/equipment", namespace, access_token),
+            get_character_section(f"{base_url}/pvp-summary", namespace, access_token),
+            get_character_section(f"{base_url}/character-media", namespace, access_token),
+        )
+        
+        # Add icons and item details from the static item store
+        try:
+            equipment_data = await enrich_equipment(equipment_data, request.game_version)
+        except Exception as e:
+            print(f"Equipment enrichment failed: {str(e)}") # Debug log
         
-        # Make request to Blizzard API
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                params={
-                    "namespace": namespace,
-                    "locale": "en_US"
-                },
-                headers={
-                    "Authorization": f"Bearer {blizzard_token}",
-                    "Accept": "application/json"
+        return {
+            'profile': {
+                'character': {
+                    **profile_data,
+                    'media': media_data
                 }
+            },
+            'equipment': equipment_data,
+            'pvp': pvp_data
+        }
+    except httpx.HTTPError as e:
+        error_detail = f"HTTP error occurred: {str(e)}"
+        print(f"HTTP error: {error_detail}") # Debug log
+        raise HTTPException(status_code=500, detail=error_detail)
+    except Exception as e:
+        error_detail = f"Unexpected error: {str(e)}"
+        print(f"Unexpected error: {error_detail}") # Debug log
+        raise HTTPException(status_code=500, detail=error_detail)
+
+@router.post('/api/character/set-main')
+async def set_main_character(request: SetMainCharacterRequest, req: Request):
+    """Set a character as the main character for the specified game version"""
+    access_token = get_access_token(req)
+
+    try:
+        # Get user profile to get battletag
+        profile_data = await get_user_profile(access_token)
+        battletag = profile_data.get('battletag')
+        account_id = profile_data.get('id')
+        
+        if not battletag or not account_id:
+            raise HTTPException(status_code=400, detail="No battletag or account ID found in profile data")
+
+        # Update database
+        db = SessionLocal()
+        try:
+            # Remove existing main character for this game version
+            db.query(MainCharacter).filter(
+                MainCharacter.id == account_id,
+                MainCharacter.game_version == request.game_version
+            ).delete()
+
+            # Add new main character
+            main_char = MainCharacter(
+                id=account_id,
+                battletag=battletag,
+                realm=request.realm.lower(),
+                name=request.name.lower(),
+                game_version=request.game_version,
+                is_main=True
             )
+            db.add(main_char)
+            db.commit()
             
-            if response.status_code != 200:
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"Failed to fetch character data: {response.text}"
-                )
+            return {"message": "Main character set successfully"}
+        finally:
+            db.close()
+
+    except httpx.HTTPError as e:
+        error_detail = f"HTTP error occurred: {str(e)}"
+        print(f"HTTP error: {error_detail}")
+        raise HTTPException(status_code=500, detail=error_detail)
+    except Exception as e:
+        error_detail = f"Unexpected error: {str(e)}"
+        print(f"Unexpected error: {error_detail}")
+        raise HTTPException(status_code=500, detail=error_detail)
+
+@router.get('/api/character/main')
+async def get_main_character(req: Request):
+    """Get the main character for the specified game version"""
+    access_token = get_access_token(req)
+
+    try:
+        # Get user profile to get account ID
+        profile_data = await get_user_profile(access_token)
+        account_id = profile_data.get('id')
+        
+        if not account_id:
+            raise HTTPException(status_code=400, detail="No account ID found in profile data")
+
+        # Get main character from database
+        db = SessionLocal()
+        try:
+            main_char = db.query(MainCharacter).filter(
+                MainCharacter.id == account_id
+            ).first()
             
-            return response.json()
+            if not main_char:
+                return {"message": "No main character set"}
             
+            return {
+                "realm": main_char.realm,
+                "name": main_char.name,
+                "game_version": main_char.game_version
+            }
+        finally:
+            db.close()
+
+    except httpx.HTTPError as e:
+        error_detail = f"HTTP error occurred: {str(e)}"
+        print(f"HTTP error: {error_detail}")
+        raise HTTPException(status_code=500, detail=error_detail)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        error_detail = f"Unexpected error: {str(e)}"
+        print(f"Unexpected error: {error_detail}")
+        raise HTTPException(status_code=500, detail=error_detail)
@@ -0,0 +1,76 @@
+import asyncio
+
+from fastapi import APIRouter, HTTPException
+import httpx
+
+from .. import snapshots
+from ..blizzard import get_battle_net_token, get_client
+from ..cache import get_cache
+from ..config import BATTLE_NET_API_URL, BRACKETS, DYNAMIC_NAMESPACES, GameVersion, SEASONS, get_settings
+
+router = APIRouter()
+
+async def fetch_leaderboard(bracket: str, game_version: GameVersion):
+    """Fetch a leaderboard from Battle.net and store it as the current snapshot"""
+    token = await get_battle_net_token()
+    namespace = DYNAMIC_NAMESPACES[game_version]  # Use dynamic namespace for leaderboard
+    season = SEASONS[game_version]
+
+    # Get the leaderboard for the current season
+    leaderboard_url = f"{BATTLE_NET_API_URL}/data/wow/pvp-season/{season}/pvp-leaderboard/{bracket}"
+    print(f"Fetching leaderboard from: {leaderboard_url}") # Debug log
+    
+    leaderboard_response = await get_client().get(
+        leaderboard_url,
+        headers={
+            "Authorization": f"Bearer {token}"
+        },
+        params={
+            "namespace": namespace,
+            "locale": "en_US"
+        }
+    )
+    
+    if leaderboard_response.status_code == 404:
+        raise HTTPException(status_code=404, detail="PvP leaderboard not found. Please check if the bracket is valid (2v2, 3v3, or 5v5)")
+    elif leaderboard_response.status_code == 401:
+        raise HTTPException(status_code=401, detail="Unauthorized. Please check your Battle.net API credentials")
+    elif leaderboard_response.status_code != 200:
+        raise HTTPException(
+            status_code=leaderboard_response.status_code,
+            detail=f"Failed to fetch PvP leaderboard: {leaderboard_response.text}"
+        )
+    
+    data = leaderboard_response.json()
+    await asyncio.to_thread(snapshots.save_leaderboard, game_version, season, bracket, data)
+    return data
+
+async def get_leaderboard(bracket: str, game_version: GameVersion):
+    """Current leaderboard via the shared cache, falling back to a fresh snapshot, then Battle.net"""
+    season = SEASONS[game_version]
+    ttl = get_settings().leaderboard_ttl
+
+    async def fill():
+        # A fresh snapshot on disk, possibly written by a sibling worker, saves a Battle.net round trip
+        await asyncio.to_thread(snapshots.load_leaderboards)
+        snapshot = snapshots.get_leaderboard(game_version, season, bracket, max_age=ttl)
+        if snapshot is not None:
+            return snapshot
+        return await fetch_leaderboard(bracket, game_version)
+
+    return await get_cache().get_or_set(f"leaderboard:{game_version.value}:{season}:{bracket}", fill, ttl=ttl)
+
+@router.get("/api/pvp-leaderboard/{bracket}")
+async def get_pvp_leaderboard(bracket: str, game_version: GameVersion = GameVersion.RETAIL):
+    """Get PvP leaderboard information for both retail and classic"""
+    if bracket not in BRACKETS:
+        raise HTTPException(status_code=400, detail="Invalid bracket. Must be one of: 2v2, 3v3, 5v5")
+    
+    try:
+        return await get_leaderboard(bracket, game_version)
+    except HTTPException:
+        raise
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=500, detail=f"Error connecting to Battle.net API: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Unexpected error: {str(e)}")
@@ -0,0 +1,79 @@
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from .. import snapshots
+from ..config import BATTLE_NET_REGION, BRACKETS, GameVersion, SEASONS, get_settings
+from ..matching import get_partner_index
+from .leaderboard import get_leaderboard
+
+router = APIRouter()
+
+async def _refresh_leaderboards(game_version: GameVersion, brackets):
+    """Bring missing or stale brackets up to date so the index searches current data"""
+    season = SEASONS[game_version]
+    ttl = get_settings().leaderboard_ttl
+    stale = [b for b in brackets if snapshots.get_leaderboard(game_version, season, b, max_age=ttl) is None]
+    if not stale:
+        return
+
+    results = await asyncio.gather(*[get_leaderboard(b, game_version) for b in stale], return_exceptions=True)
+    await asyncio.to_thread(snapshots.load_leaderboards)
+    for bracket, data in zip(stale, results):
+        if isinstance(data, HTTPException):
+            print(f"Could not load {bracket} leaderboard for partner search: {data.detail}")
+        elif isinstance(data, Exception):
+            print(f"Could not load {bracket} leaderboard for partner search: {str(data)}")
+        elif snapshots.get_leaderboard(game_version, season, bracket, max_age=ttl) is None:
+            # Served from a cache another host filled; keep a local snapshot to index
+            await asyncio.to_thread(snapshots.save_leaderboard, game_version, season, bracket, data)
+
+@router.get('/api/partners')
+async def find_partners(
+    rating: int,
+    game_version: GameVersion = GameVersion.RETAIL,
+    bracket: Optional[str] = None,
+    region: str = BATTLE_NET_REGION,
+    faction: Optional[str] = None,
+    realm: Optional[str] = None,
+    name: Optional[str] = None,
+    max_rating_diff: int = Query(300, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """Find leaderboard players close in rating, favouring same-realm and recently active players
+
+    realm and name describe the player searching: same-realm partners rank
+    higher and the player themselves is left out. recent_games counts games
+    played over roughly the last day. Lower score is better.
+    """
+    if bracket is not None and bracket not in BRACKETS:
+        raise HTTPException(status_code=400, detail="Invalid bracket. Must be one of: 2v2, 3v3, 5v5")
+    if region != BATTLE_NET_REGION:
+        raise HTTPException(status_code=400, detail=f"Unsupported region. Partner search covers: {BATTLE_NET_REGION}")
+
+    brackets = (bracket,) if bracket else BRACKETS
+    await _refresh_leaderboards(game_version, brackets)
+    index = await get_partner_index()
+    if not any(index.has_bucket(game_version, b) for b in brackets):
+        raise HTTPException(status_code=503, detail="Leaderboard data is not available yet. Please try again shortly")
+
+    realm_slug = realm.lower() if realm else None
+    exclude = f"{realm_slug}/{name.lower()}" if realm_slug and name else None
+
+    matches = index.find_partners(
+        game_version,
+        rating,
+        bracket=bracket,
+        faction=faction,
+        realm=realm_slug,
+        exclude=exclude,
+        limit=limit,
+        max_rating_diff=max_rating_diff,
+    )
+    return {
+        'partners': [
+            {**player._asdict(), 'score': score}
+            for score, player in matches
+        ]
+    }
@@ -0,0 +1,80 @@
+from fastapi import APIRouter, HTTPException, Request
+import httpx
+
+from ..blizzard import get_access_token, get_user_profile
+from ..database import SessionLocal, SocialLinks
+from ..schemas import SocialLinksRequest
+
+router = APIRouter()
+
+@router.post('/api/social-links')
+async def update_social_links(request: SocialLinksRequest, req: Request):
+    """Update social media links for a user"""
+    access_token = get_access_token(req)
+
+    try:
+        # Get user profile to get battletag
+        profile_data = await get_user_profile(access_token)
+        battletag = profile_data.get('battletag')
+        
+        if not battletag:
+            raise HTTPException(status_code=400, detail="No battletag found in profile data")
+
+        # Update database
+        db = SessionLocal()
+        try:
+            # Check if social links exist for this battletag
+            social_links = db.query(SocialLinks).filter(SocialLinks.battletag == battletag).first()
+            
+            if social_links:
+                # Update existing social links
+                for key, value in request.dict().items():
+                    if value is not None:
+                        setattr(social_links, key, value)
+            else:
+                # Create new social links
+                social_links = SocialLinks(
+                    battletag=battletag,
+                    **request.dict()
+                )
+                db.add(social_links)
+            
+            db.commit()
+            return {"message": "Social links updated successfully"}
+        finally:
+            db.close()
+
+    except httpx.HTTPError as e:
+        error_detail = f"HTTP error occurred: {str(e)}"
+        print(f"HTTP error: {error_detail}")
+        raise HTTPException(status_code=500, detail=error_detail)
+    except Exception as e:
+        error_detail = f"Unexpected error: {str(e)}"
+        print(f"Unexpected error: {error_detail}")
+        raise HTTPException(status_code=500, detail=error_detail)
+
+@router.get('/api/social-links/{battletag}')
+async def get_social_links(battletag: str):
+    """Get social media links for a user"""
+    try:
+        db = SessionLocal()
+        try:
+            social_links = db.query(SocialLinks).filter(SocialLinks.battletag == battletag).first()
+            
+            if not social_links:
+                return {"message": "No social links found"}
+            
+            return {
+                "discord": social_links.discord,
+                "twitch": social_links.twitch,
+                "twitter": social_links.twitter,
+                "youtube": social_links.youtube,
+                "instagram": social_links.instagram
+            }
+        finally:
+            db.close()
+
+    except Exception as e:
+        error_detail = f"Unexpected error: {str(e)}"
+        print(f"Unexpected error: {error_detail}")
+        raise HTTPException(status_code=500, detail=error_detail)
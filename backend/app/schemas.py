@@ -0,0 +1,29 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .config import GameVersion
+
+class OAuthRequest(BaseModel):
+    state: str
+
+class OAuthCallback(BaseModel):
+    code: str
+    state: str
+
+class CharacterRequest(BaseModel):
+    realm: str
+    name: str
+    game_version: GameVersion
+
+class SetMainCharacterRequest(BaseModel):
+    realm: str
+    name: str
+    game_version: GameVersion
+
+class SocialLinksRequest(BaseModel):
+    discord: Optional[str] = None
+    twitch: Optional[str] = None
+    twitter: Optional[str] = None
+    youtube: Optional[str] = None
+    instagram: Optional[str] = None
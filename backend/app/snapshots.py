@@ -0,0 +1,133 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .config import BRACKETS, GameVersion, SEASONS, get_settings
+
+# Activity is measured against the oldest baseline within this window. A new
+# baseline (games played per character) is recorded at most once per interval,
+# so the window stays close to a day no matter how often leaderboards refresh.
+ACTIVITY_WINDOW = 24 * 3600
+ACTIVITY_BASELINE_INTERVAL = 2 * 3600
+
+# (game_version, season, bracket) -> {'fetched_at', 'data', 'baselines'}
+# 'baselines' is a list of {'fetched_at', 'played'}, oldest first. Baselines
+# live in their own file and are only rewritten when one is added or expires.
+_leaderboards: Dict[Tuple[str, int, str], dict] = {}
+# Snapshot file path -> mtime we last loaded or wrote
+_mtimes: Dict[str, int] = {}
+# Loading and saving do blocking file I/O and run in worker threads
+_lock = threading.Lock()
+
+def _snapshot_path(game_version: GameVersion, season: int, bracket: str, suffix: str = '') -> str:
+    return os.path.join(get_settings().snapshot_dir, f"leaderboard-{game_version.value}-{season}-{bracket}{suffix}.json")
+
+def character_key(entry: dict) -> str:
+    """Identify a leaderboard entry's character as realm-slug/name"""
+    character = entry.get('character', {})
+    return f"{character.get('realm', {}).get('slug', '')}/{character.get('name', '').lower()}"
+
+def _played_by_character(data: dict) -> Dict[str, int]:
+    return {
+        character_key(entry): entry.get('season_match_statistics', {}).get('played', 0)
+        for entry in data.get('entries', [])
+    }
+
+def _within_window(baselines: List[dict], now: float) -> List[dict]:
+    return [baseline for baseline in baselines if now - baseline['fetched_at'] <= ACTIVITY_WINDOW]
+
+def activity_baseline(snapshot: dict) -> Optional[dict]:
+    """Oldest baseline still within the activity window, or None if there is none"""
+    baselines = _within_window(snapshot.get('baselines') or [], time.time())
+    return baselines[0] if baselines else None
+
+def get_snapshot(game_version: GameVersion, season: int, bracket: str) -> Optional[dict]:
+    return _leaderboards.get((game_version.value, season, bracket))
+
+def get_leaderboard(game_version: GameVersion, season: int, bracket: str, max_age: Optional[float] = None) -> Optional[dict]:
+    """Return the in-memory leaderboard snapshot, or None if missing or older than max_age"""
+    snapshot = get_snapshot(game_version, season, bracket)
+    if snapshot is None:
+        return None
+    if max_age is not None and time.time() - snapshot['fetched_at'] > max_age:
+        return None
+    return snapshot['data']
+
+def _write_json(path: str, payload):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write to a temp file and rename so other workers never read a partial snapshot
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(payload, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    _mtimes[path] = os.stat(path).st_mtime_ns
+
+def save_leaderboard(game_version: GameVersion, season: int, bracket: str, data: dict):
+    """Keep the leaderboard in memory and persist it for the next worker start
+
+    Blocking; call it through asyncio.to_thread from request handlers.
+    """
+    with _lock:
+        # Another worker may have written a newer snapshot; build on that one, not our stale copy
+        _load_leaderboards()
+        current = get_snapshot(game_version, season, bracket)
+        now = time.time()
+        old_baselines = current['baselines'] if current is not None else []
+        baselines = _within_window(old_baselines, now)
+        if current is not None and (not baselines or current['fetched_at'] - baselines[-1]['fetched_at'] >= ACTIVITY_BASELINE_INTERVAL):
+            baselines.append({'fetched_at': current['fetched_at'], 'played': _played_by_character(current['data'])})
+        _leaderboards[(game_version.value, season, bracket)] = {'fetched_at': now, 'data': data, 'baselines': baselines}
+
+        try:
+            if baselines != old_baselines:
+                _write_json(_snapshot_path(game_version, season, bracket, '-baselines'), baselines)
+            _write_json(_snapshot_path(game_version, season, bracket), {'fetched_at': now, 'data': data})
+        except OSError as e:
+            print(f"Failed to persist leaderboard snapshot for {bracket}: {str(e)}")
+
+def _read_if_changed(path: str):
+    """Return the parsed file if it changed since we last read or wrote it, else None"""
+    mtime = os.stat(path).st_mtime_ns
+    if _mtimes.get(path) == mtime:
+        return None
+    with open(path) as f:
+        payload = json.load(f)
+    _mtimes[path] = mtime
+    return payload
+
+def _load_leaderboards():
+    loaded = 0
+    for game_version, season in SEASONS.items():
+        for bracket in BRACKETS:
+            key = (game_version.value, season, bracket)
+            path = _snapshot_path(game_version, season, bracket)
+            baselines_path = _snapshot_path(game_version, season, bracket, '-baselines')
+            try:
+                snapshot = _read_if_changed(path)
+                if snapshot is not None:
+                    snapshot['baselines'] = _leaderboards.get(key, {}).get('baselines', [])
+                    _leaderboards[key] = snapshot
+                    loaded += 1
+                if key in _leaderboards:
+                    baselines = _read_if_changed(baselines_path)
+                    if baselines is not None:
+                        _leaderboards[key]['baselines'] = baselines
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as e:
+                print(f"Skipping unreadable leaderboard snapshot {path}: {str(e)}")
+                continue
+    return loaded
+
+def load_leaderboards():
+    """Load persisted snapshots for the current seasons that changed since we last saw them
+
+    Unchanged files cost one stat each. Blocking; call it through
+    asyncio.to_thread from request handlers. Returns the number of
+    snapshots (re)loaded.
+    """
+    with _lock:
+        return _load_leaderboards()
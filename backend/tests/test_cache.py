@@ -0,0 +1,224 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from app.cache import Cache
+from app.cache.redis_store import RedisCache
+from app.cache.shm import LOCK_STRIPES, SharedMemoryCache
+
+class StubRedis:
+    """Just enough of a RESP server for the commands RedisCache sends"""
+
+    def __init__(self, respond=True):
+        self.respond = respond
+        self.store = {}
+        self.connections = 0
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, '127.0.0.1', 0)
+        return f"redis://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/0"
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    def _live(self, key):
+        entry = self.store.get(key)
+        if entry is not None and entry[1] is not None and entry[1] < time.time():
+            del self.store[key]
+            return None
+        return entry
+
+    async def _read_command(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int((await reader.readline())[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        while True:
+            args = await self._read_command(reader)
+            if args is None:
+                break
+            if not self.respond:
+                continue
+            command = args[0].upper()
+            if command == b'GET':
+                entry = self._live(args[1])
+                value = entry[0] if entry else None
+                writer.write(b'$-1\r\n' if value is None else b'$%d\r\n%s\r\n' % (len(value), value))
+            elif command == b'SET':
+                options = [arg.upper() for arg in args[3:]]
+                expires_at = None
+                if b'PX' in options:
+                    expires_at = time.time() + int(args[3 + options.index(b'PX') + 1]) / 1000
+                if b'NX' in options and self._live(args[1]):
+                    writer.write(b'$-1\r\n')
+                else:
+                    self.store[args[1]] = (args[2], expires_at)
+                    writer.write(b'+OK\r\n')
+            elif command == b'DEL':
+                writer.write(b':%d\r\n' % (1 if self.store.pop(args[1], None) else 0))
+            elif command == b'EVAL':
+                entry = self._live(args[3])
+                if entry and entry[0] == args[4]:
+                    del self.store[args[3]]
+                    writer.write(b':1\r\n')
+                else:
+                    writer.write(b':0\r\n')
+            else:
+                writer.write(b'-ERR unknown command\r\n')
+            await writer.drain()
+        writer.close()
+
+async def _with_backend(kind, tmp_path, body):
+    if kind == 'shm':
+        await body(lambda: SharedMemoryCache(str(tmp_path)))
+        return
+    stub = StubRedis()
+    url = await stub.start()
+    try:
+        await body(lambda: RedisCache(url, timeout=1.0))
+    finally:
+        await stub.stop()
+
+@pytest.mark.parametrize('kind', ['redis', 'shm'])
+def test_one_fill_shared_by_several_caches(kind, tmp_path):
+    async def body(make_backend):
+        # Separate Cache instances stand in for separate workers
+        caches = [Cache(make_backend()) for _ in range(3)]
+        calls = 0
+
+        async def fill():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.1)
+            return {'value': [1, 2, 3]}
+
+        results = await asyncio.gather(*[cache.get_or_set('key', fill, 5) for cache in caches for _ in range(4)])
+        assert calls == 1
+        assert all(result == {'value': [1, 2, 3]} for result in results)
+        for cache in caches:
+            await cache.close()
+
+    asyncio.run(_with_backend(kind, tmp_path, body))
+
+@pytest.mark.parametrize('kind', ['redis', 'shm'])
+def test_none_result_is_not_cached(kind, tmp_path):
+    async def body(make_backend):
+        cache = Cache(make_backend())
+        calls = 0
+
+        async def fill():
+            nonlocal calls
+            calls += 1
+            return None
+
+        assert await cache.get_or_set('key', fill, 5) is None
+        assert await cache.get_or_set('key', fill, 5) is None
+        assert calls == 2
+        await cache.close()
+
+    asyncio.run(_with_backend(kind, tmp_path, body))
+
+@pytest.mark.parametrize('kind', ['redis', 'shm'])
+def test_failed_fill_releases_lock_and_retries(kind, tmp_path):
+    async def body(make_backend):
+        cache = Cache(make_backend())
+        other = Cache(make_backend())
+
+        async def failing():
+            raise RuntimeError('upstream down')
+
+        async def working():
+            return 'ok'
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_set('key', failing, 5)
+        # The lock was released, so another worker fills straight away
+        start = time.monotonic()
+        assert await other.get_or_set('key', working, 5) == 'ok'
+        assert time.monotonic() - start < 1
+        await cache.close()
+        await other.close()
+
+    asyncio.run(_with_backend(kind, tmp_path, body))
+
+@pytest.mark.parametrize('kind', ['redis', 'shm'])
+def test_lock_release_only_by_holder(kind, tmp_path):
+    async def body(make_backend):
+        first, second = make_backend(), make_backend()
+        token = await first.acquire_lock('key', 5)
+        assert token
+        assert await second.acquire_lock('key', 5) is None
+        await second.release_lock('key', 'not-the-token')
+        assert await second.acquire_lock('key', 5) is None
+        await first.release_lock('key', token)
+        assert await second.acquire_lock('key', 5)
+        await first.close()
+        await second.close()
+
+    asyncio.run(_with_backend(kind, tmp_path, body))
+
+def test_redis_error_reply_does_not_leak_connection():
+    async def run():
+        stub = StubRedis()
+        backend = RedisCache(await stub.start(), pool_size=1, timeout=1.0)
+        await backend.set('key', b'value', 5)
+        assert len(backend._pool) == 1
+        with pytest.raises(Exception):
+            await backend.execute('BOGUS')
+        assert backend._pool == []
+        # The slot was freed and a fresh connection is opened
+        assert await backend.get('key') == b'value'
+        assert stub.connections == 2
+        await backend.close()
+        await stub.stop()
+
+    asyncio.run(run())
+
+def test_unresponsive_redis_is_a_miss():
+    async def run():
+        stub = StubRedis(respond=False)
+        cache = Cache(RedisCache(await stub.start(), timeout=0.2))
+
+        async def fill():
+            return 'filled'
+
+        start = time.monotonic()
+        assert await cache.get('key') is None
+        assert await cache.get_or_set('key', fill, 5) == 'filled'
+        assert time.monotonic() - start < 2
+        await cache.close()
+        await stub.stop()
+
+    asyncio.run(run())
+
+def test_shm_lock_and_temp_files_stay_bounded(tmp_path):
+    async def run():
+        backend = SharedMemoryCache(str(tmp_path))
+        for i in range(1000):
+            token = await backend.acquire_lock(f"userinfo:{i}", 5)
+            assert token
+            await backend.release_lock(f"userinfo:{i}", token)
+        stale = tmp_path / 'orphan.tmp'
+        stale.write_bytes(b'partial')
+        os.utime(stale, (time.time() - 3600, time.time() - 3600))
+        fresh = tmp_path / 'writing.tmp'
+        fresh.write_bytes(b'partial')
+
+        backend.prune()
+
+        names = os.listdir(tmp_path)
+        assert len([name for name in names if name.endswith('.lock')]) <= LOCK_STRIPES
+        assert 'orphan.tmp' not in names
+        assert 'writing.tmp' in names
+
+    asyncio.run(run())
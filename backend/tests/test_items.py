@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app import blizzard, cache, database, items
+from app.config import GameVersion, get_settings
+
+@pytest.fixture(autouse=True)
+def isolated_store(tmp_path, monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', f"sqlite:///{tmp_path / 'items.db'}")
+    monkeypatch.setenv('BATTLE_NET_CLIENT_ID', 'id')
+    monkeypatch.setenv('BATTLE_NET_CLIENT_SECRET', 'secret')
+    for cached in (get_settings, database.get_engine, database._session_factory):
+        cached.cache_clear()
+    monkeypatch.setattr(items, '_items', {})
+    monkeypatch.setattr(cache, '_cache', None)
+    monkeypatch.setattr(blizzard, '_token', None)
+    database.init_db()
+    yield
+    for cached in (get_settings, database.get_engine, database._session_factory):
+        cached.cache_clear()
+
+def _upstream(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if request.url.path == '/token':
+            return httpx.Response(200, json={'access_token': 'token', 'expires_in': 86400})
+        item_id = int(request.url.path.rsplit('/', 1)[1])
+        if '/media/' in request.url.path:
+            return httpx.Response(200, json={'assets': [{'key': 'icon', 'value': f"https://icons/{item_id}.jpg"}]})
+        return httpx.Response(200, json={'id': item_id, 'name': f"Item {item_id}", 'level': 400})
+
+    monkeypatch.setattr(blizzard, '_client', httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return calls
+
+def test_warm_store_makes_no_upstream_requests(monkeypatch):
+    calls = _upstream(monkeypatch)
+    equipment = {'equipped_items': [{'item': {'id': 1}}, {'item': {'id': 2}}]}
+
+    enriched = asyncio.run(items.enrich_equipment(equipment, GameVersion.RETAIL))
+    assert [e['icon'] for e in enriched['equipped_items']] == ['https://icons/1.jpg', 'https://icons/2.jpg']
+
+    db = database.SessionLocal()
+    try:
+        assert sorted(row.item_id for row in db.query(database.StaticItem)) == [1, 2]
+    finally:
+        db.close()
+
+    # Drop the in-process copy and the cache: the database alone must serve the second render
+    calls.clear()
+    items._items.clear()
+    cache._cache = None
+    asyncio.run(items.enrich_equipment(equipment, GameVersion.RETAIL))
+    assert calls == []
+
+def test_failed_store_still_returns_summary(monkeypatch):
+    _upstream(monkeypatch)
+
+    def locked(*args, **kwargs):
+        raise OperationalError('INSERT', {}, Exception('database is locked'))
+
+    monkeypatch.setattr(database.SessionLocal().__class__, 'commit', locked)
+
+    found = asyncio.run(items.get_items(GameVersion.RETAIL, [7]))
+    assert found[7]['name'] == 'Item 7'
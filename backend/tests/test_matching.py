@@ -0,0 +1,63 @@
+import asyncio
+import random
+
+import pytest
+
+from app import matching, snapshots
+from app.config import GameVersion, SEASONS, get_settings
+
+SEASON = SEASONS[GameVersion.RETAIL]
+
+def _board(players):
+    return {'entries': [
+        {
+            'character': {'name': name, 'realm': {'slug': realm}},
+            'faction': {'type': faction},
+            'rating': rating,
+            'season_match_statistics': {'played': played},
+        }
+        for name, realm, faction, rating, played in players
+    ]}
+
+@pytest.fixture(autouse=True)
+def isolated_snapshots(tmp_path, monkeypatch):
+    monkeypatch.setenv('SNAPSHOT_DIR', str(tmp_path))
+    get_settings.cache_clear()
+    monkeypatch.setattr(snapshots, '_leaderboards', {})
+    monkeypatch.setattr(snapshots, '_mtimes', {})
+    monkeypatch.setattr(matching, '_index', matching.PartnerIndex())
+    yield
+    get_settings.cache_clear()
+
+def test_top_k_matches_brute_force():
+    rng = random.Random(7)
+    players = [
+        (f"p{i}", f"realm{i % 5}", rng.choice(['HORDE', 'ALLIANCE']), rng.randint(1500, 2500), 50)
+        for i in range(2000)
+    ]
+    snapshots.save_leaderboard(GameVersion.RETAIL, SEASON, '3v3', _board(players))
+    index = asyncio.run(matching.get_partner_index())
+
+    matches = index.find_partners(GameVersion.RETAIL, 2000, faction='horde', realm='realm1', limit=10)
+
+    bucket_players = [p for p in index._buckets[('retail', 'us', '3v3')].players if p.faction == 'HORDE' and abs(p.rating - 2000) <= 300]
+    expected = sorted(matching._penalty(p, 2000, 'realm1') for p in bucket_players)[:10]
+    assert [score for score, _ in matches] == expected
+
+def test_activity_baseline_survives_frequent_refreshes():
+    for played in (10, 12, 15):
+        snapshots.save_leaderboard(GameVersion.RETAIL, SEASON, '2v2', _board([('a', 'r', 'HORDE', 2000, played)]))
+
+    [(_, player)] = asyncio.run(matching.get_partner_index()).find_partners(GameVersion.RETAIL, 2000, bracket='2v2')
+    # Measured from the first snapshot, not just the last refresh
+    assert player.recent_games == 5
+
+def test_expired_baseline_is_ignored_until_rewritten(monkeypatch):
+    for played in (10, 15):
+        snapshots.save_leaderboard(GameVersion.RETAIL, SEASON, '2v2', _board([('a', 'r', 'HORDE', 2000, played)]))
+    snapshot = snapshots.get_snapshot(GameVersion.RETAIL, SEASON, '2v2')
+    assert snapshots.activity_baseline(snapshot) is not None
+
+    later = snapshot['baselines'][0]['fetched_at'] + snapshots.ACTIVITY_WINDOW + 1
+    monkeypatch.setattr(snapshots.time, 'time', lambda: later)
+    assert snapshots.activity_baseline(snapshot) is None
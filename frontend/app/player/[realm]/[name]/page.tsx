@@ -4,7 +4,6 @@ import { useState, useEffect, Suspense } from 'react';
 import { useRouter, useSearchParams } from 'next/navigation';
 import { useAuth } from '@/contexts/AuthContext';
 import { useGameVersion } from '@/contexts/GameVersionContext';
-import { useRegion } from '@/contexts/RegionContext';
 import { getCharacterEndpoint } from '@/utils/blizzardApi';
 import {
   Box,
@@ -91,7 +90,6 @@ function CharacterContent({ params }: { params: Promise<{ realm: string; name: s
   const searchParams = useSearchParams();
   const { isAuthenticated, accessToken } = useAuth();
   const { gameVersion } = useGameVersion();
-  const { region } = useRegion();
   const [character, setCharacter] = useState<Character | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -114,15 +112,18 @@ function CharacterContent({ params }: { params: Promise<{ realm: string; name: s
 
       try {
         // Fetch detailed character data from our backend
-        const response = await fetch(
-          `http://localhost:8000/api/character/${region}/${realmSlug}/${characterName}?game_version=${gameVersion}`,
-          {
-            headers: {
-              'Authorization': `Bearer ${accessToken}`,
-              'Accept': 'application/json'
-            }
-          }
-        );
+        const response = await fetch('http://localhost:8000/api/character', {
+          method: 'POST',
+          headers: {
+            'Authorization': `Bearer ${accessToken}`,
+            'Content-Type': 'application/json'
+          },
+          body: JSON.stringify({
+            realm: realmSlug,
+            name: characterName,
+            game_version: gameVersion
+          })
+        });
 
         if (!response.ok) {
           throw new Error('Failed to fetch character data');
@@ -140,7 +141,7 @@ function CharacterContent({ params }: { params: Promise<{ realm: string; name: s
     if (isAuthenticated && accessToken) {
       fetchCharacterData();
     }
-  }, [isAuthenticated, router, accessToken, gameVersion, realmSlug, characterName, region]);
+  }, [isAuthenticated, router, accessToken, gameVersion, realmSlug, characterName]);
 
   const handleTabChange = (event: React.SyntheticEvent, newValue: number) => {
     setTabValue(newValue);